@@ -0,0 +1,45 @@
+"""Synthetic feature files for the benchmarks."""
+
+import textwrap
+
+from rumex import InputFile
+
+_SCENARIO = textwrap.dedent('''
+    @tag_{tag}
+    Scenario: Scenario number {num}
+
+        Some description.
+
+        Given an empty database
+        And a user called <name>
+        When the user adds the following items:
+            | item     | price | quantity |
+            +----------+-------+----------+
+            | apple    |  1.25 |        3 |
+            | banana   |  0.50 |       12 |
+            | cherry\\| |  9.99 |        1 |
+        And the user writes a note:
+            """
+            Remember to buy milk.
+            """
+        Then the total is <total>
+
+        Examples:
+            | name  | total |
+            | Alice | 19.74 |
+            | Bob   | 19.74 |
+''')
+
+
+def make_text(*, scenarios):
+    return "Name: Generated file\n\nSome description.\n" + "".join(
+        _SCENARIO.format(num=num, tag=num % 10) for num in range(scenarios)
+    )
+
+
+def make_files(*, files, scenarios):
+    text = make_text(scenarios=scenarios)
+    return [
+        InputFile(uri=f"generated_{num}.feature", text=text)
+        for num in range(files)
+    ]
@@ -0,0 +1,111 @@
+"""Measure memory retained by parsed files, per scenario.
+
+Compares the current representation (slotted dataclasses, interned
+strings, columnar tables) with an equivalent one made of regular
+dataclasses, separate string copies and tables of `dict`s.
+
+Usage: python -m benchmarks.memory [number of files]
+"""
+
+import sys
+import tracemalloc
+from dataclasses import dataclass
+from typing import Any
+
+from rumex.parsing.parser import parse
+from rumex.parsing.table import Table
+
+from .corpus import make_files
+
+
+@dataclass(frozen=True, kw_only=True)
+class _Step:
+    sentence: str
+    data: Any
+
+
+@dataclass(frozen=True, kw_only=True)
+class _Scenario:
+    name: str
+    description: str | None
+    steps: Any
+    tags: Any
+    examples_data: Any
+
+
+@dataclass(frozen=True, kw_only=True)
+class _ParsedFile:
+    name: str | None
+    description: str | None
+    scenarios: Any
+    uri: str
+
+
+def _copy(text):
+    return text if text is None else text.encode().decode()
+
+
+def _copy_table(table):
+    header = [_copy(key) for key in table.header]
+    return tuple(
+        {key: _copy(value) for key, value in zip(header, row, strict=False)}
+        for row in table.rows
+    )
+
+
+def _copy_data(data):
+    if isinstance(data, Table):
+        return _copy_table(data)
+    return _copy(data)
+
+
+def _as_plain(parsed):
+    return _ParsedFile(
+        name=_copy(parsed.name),
+        description=_copy(parsed.description),
+        uri=_copy(parsed.uri),
+        scenarios=[
+            _Scenario(
+                name=_copy(scenario.name),
+                description=_copy(scenario.description),
+                tags=tuple(map(_copy, scenario.tags)),
+                examples_data=_copy_table(scenario.examples_data),
+                steps=[
+                    _Step(
+                        sentence=_copy(step.sentence),
+                        data=_copy_data(step.data),
+                    )
+                    for step in scenario.steps
+                ],
+            )
+            for scenario in parsed.scenarios
+        ],
+    )
+
+
+def _measure_retained(fn):
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    result = fn()
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return after - before, result
+
+
+def main(number_of_files):
+    files = make_files(files=number_of_files, scenarios=10)
+    number_of_scenarios = number_of_files * 10
+
+    current, parsed = _measure_retained(lambda: [parse(f) for f in files])
+    plain, _ = _measure_retained(lambda: [_as_plain(p) for p in parsed])
+
+    print(f"{number_of_scenarios} scenarios, bytes per scenario:")
+    print(f"    plain:   {plain / number_of_scenarios:8.0f}")
+    print(
+        f"    current: {current / number_of_scenarios:8.0f}"
+        f" ({current / plain:.0%})",
+    )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 500)
@@ -0,0 +1,58 @@
+"""Compare serial and process pool parsing of a large corpus.
+
+Also measures the cost of sending files to and from the workers.
+
+Usage: python -m benchmarks.parallel_parsing [number of files]
+"""
+
+import os
+import pickle
+import sys
+import time
+
+from rumex.parallel import parse_files
+from rumex.parsing.parser import parse
+
+from .corpus import make_files
+
+
+def _measure(fn):
+    start = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - start, result
+
+
+def main(number_of_files):
+    files = make_files(files=number_of_files, scenarios=10)
+
+    serial, parsed = _measure(lambda: list(map(parse, files)))
+    print(f"{number_of_files} files, serial: {serial:.2f}s")
+
+    for workers in sorted({1, 2, 4, os.cpu_count() or 1}):
+        elapsed, _ = _measure(
+            lambda workers=workers: list(
+                parse_files(files, max_workers=workers),
+            ),
+        )
+        print(
+            f"{workers} worker(s): {elapsed:.2f}s ({serial / elapsed:.2f}x)",
+        )
+
+    for name, objects in [("InputFile", files), ("ParsedFile", parsed)]:
+        elapsed, dumped = _measure(
+            lambda objects=objects: [
+                pickle.dumps(obj, pickle.HIGHEST_PROTOCOL) for obj in objects
+            ],
+        )
+        loaded, _ = _measure(
+            lambda dumped=dumped: [pickle.loads(data) for data in dumped],  # noqa: S301
+        )
+        size = sum(map(len, dumped)) / len(dumped)
+        print(
+            f"{name} pickle round trip: {elapsed + loaded:.2f}s,"
+            f" {size / 1024:.1f} KiB per file",
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
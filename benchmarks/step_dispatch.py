@@ -0,0 +1,72 @@
+"""Compare a linear scan of step patterns with the step index.
+
+Usage: python -m benchmarks.step_dispatch [number of step definitions]
+"""
+
+import re
+import sys
+import timeit
+
+from rumex.runner import _StepIndex
+
+_NOUNS = ["user", "basket", "order", "invoice", "account", "customer"]
+
+
+def _make_patterns(number):
+    return [
+        re.compile(
+            rf"the {_NOUNS[i % 6]} (\w+) has (\d+) {_NOUNS[i // 6 % 6]}s"
+            rf" from batch {i}$",
+        )
+        for i in range(number)
+    ]
+
+
+def _make_sentences(number):
+    return [
+        f"Given the {_NOUNS[i % 6]} bob has 3 {_NOUNS[i // 6 % 6]}s"
+        f" from batch {i}"
+        for i in range(0, number, max(1, number // 200))
+    ]
+
+
+def _linear_search(patterns, sentence):
+    for pattern in patterns:
+        if match_ := pattern.search(sentence):
+            return match_
+    return None
+
+
+def main(number_of_steps):
+    patterns = _make_patterns(number_of_steps)
+    sentences = _make_sentences(number_of_steps)
+    index = _StepIndex()
+    for pattern in patterns:
+        index.add(pattern)
+
+    for sentence in sentences:
+        assert (
+            index.search(sentence).re
+            is _linear_search(
+                patterns,
+                sentence,
+            ).re
+        )
+
+    for name, fn in [
+        ("linear", lambda s: _linear_search(patterns, s)),
+        ("indexed", index.search),
+    ]:
+        seconds = min(
+            timeit.repeat(
+                lambda fn=fn: [fn(s) for s in sentences],
+                number=3,
+                repeat=3,
+            ),
+        )
+        per_step = seconds / 3 / len(sentences) * 1e6
+        print(f"{name}: {per_step:.1f}us per step")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
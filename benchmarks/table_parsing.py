@@ -0,0 +1,76 @@
+"""Compare table parsing strategies on a large table.
+
+Usage: python -m benchmarks.table_parsing [number of rows]
+"""
+
+import sys
+import timeit
+
+from rumex.parsing.table import (
+    BadTableLineError,
+    parse_table_line,
+    parse_table_lines,
+)
+
+
+def _parse_with_character_loop(line, *, delimiter):
+    line = line.strip()
+    if len(line) < 2 or line[0] != delimiter or line[-1] != delimiter:  # noqa: PLR2004
+        raise BadTableLineError(line)
+    line = line[1:]
+
+    values = []
+    current_value = []
+    escape_next_symbol = False
+    for symbol in line:
+        if escape_next_symbol:
+            current_value.append(symbol)
+            escape_next_symbol = False
+        elif symbol == delimiter:
+            values.append("".join(current_value).strip())
+            current_value = []
+        elif symbol == "\\":
+            escape_next_symbol = True
+        else:
+            current_value.append(symbol)
+
+    if current_value:
+        raise BadTableLineError(line)
+
+    return tuple(values)
+
+
+def main(number_of_rows):
+    lines = [
+        f"    | item {num} | {num * 1.5:8.2f} | {num % 7:3d} | note |"
+        for num in range(number_of_rows)
+    ]
+    escaped_lines = [line.replace("note", "no\\|te") for line in lines]
+
+    for name, table in [("plain", lines), ("escaped", escaped_lines)]:
+        candidates = {
+            "character loop": lambda table=table: [
+                _parse_with_character_loop(line, delimiter="|")
+                for line in table
+            ],
+            "parse_table_line": lambda table=table: [
+                parse_table_line(line, delimiter="|") for line in table
+            ],
+            "parse_table_lines": lambda table=table: parse_table_lines(
+                table,
+                delimiter="|",
+            ),
+        }
+        print(f"{number_of_rows} {name} rows:")
+        baseline = None
+        for label, fn in candidates.items():
+            elapsed = min(timeit.repeat(fn, number=1, repeat=5))
+            baseline = baseline or elapsed
+            print(
+                f"    {label:>18}: {elapsed * 1000:8.2f}ms"
+                f" ({baseline / elapsed:.1f}x)",
+            )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000)
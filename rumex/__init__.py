@@ -12,12 +12,12 @@ __version__ = "0.7.0"
 
 
 __all__ = (
+    "ExecutorProto",
     "InputFile",
     "ParserProto",
-    "ExecutorProto",
     "StepMapper",
     "StepMapperProto",
-    "find_input_files",
     "execute_file",
+    "find_input_files",
     "run",
 )
@@ -0,0 +1,87 @@
+import concurrent.futures
+import itertools
+from collections.abc import Callable, Iterable, Iterator
+from typing import Any
+
+from .parsing.core import InputFile, ParsedFile, ParserProto
+from .parsing.parser import parse
+
+
+class ProcessPoolMap:
+    """Replacement for the built-in `map` that uses multiple processes.
+
+    Can be passed as `map_` or `parser_map` to `run`.
+    The mapped function and the items must be picklable.
+
+    Params
+    ------
+    max_workers:
+        Number of processes, see `concurrent.futures.ProcessPoolExecutor`.
+
+    chunksize: Number of items sent to a process at once.
+
+    ordered:
+        If `True`, results are returned in the order of the items.
+        Otherwise they are returned as soon as they are ready.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_workers: int | None = None,
+        chunksize: int = 64,
+        ordered: bool = True,
+    ):
+        self._max_workers = max_workers
+        self._chunksize = chunksize
+        self._ordered = ordered
+
+    def __call__(
+        self,
+        fn: Callable[[Any], Any],
+        iterable: Iterable[Any],
+    ) -> Iterator[Any]:
+        pool = concurrent.futures.ProcessPoolExecutor(
+            max_workers=self._max_workers,
+        )
+        try:
+            futures = [
+                pool.submit(_map_chunk, fn, chunk)
+                for chunk in _iter_chunks(iterable, size=self._chunksize)
+            ]
+            if not self._ordered:
+                futures = concurrent.futures.as_completed(futures)
+            for future in futures:
+                yield from future.result()
+        finally:
+            pool.shutdown(cancel_futures=True)
+
+
+def parse_files(
+    files: Iterable[InputFile],
+    *,
+    parser: ParserProto = parse,
+    max_workers: int | None = None,
+    chunksize: int = 64,
+    ordered: bool = True,
+) -> Iterator[ParsedFile]:
+    """Parse files, e.g. found by `find_input_files`, in parallel.
+
+    See `ProcessPoolMap` for the description of the parameters.
+    """
+    map_ = ProcessPoolMap(
+        max_workers=max_workers,
+        chunksize=chunksize,
+        ordered=ordered,
+    )
+    return map_(parser, files)
+
+
+def _map_chunk(fn, chunk):
+    return [fn(item) for item in chunk]
+
+
+def _iter_chunks(iterable, *, size):
+    iterator = iter(iterable)
+    while chunk := list(itertools.islice(iterator, size)):
+        yield chunk
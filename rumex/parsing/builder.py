@@ -1,7 +1,17 @@
+import collections
+import sys
 import textwrap
 
 from .core import ParsedFile, Scenario, Step
-from .table import parse_table_line
+from .table import Table, parse_table_line
+
+_TABLE_BREAK_SYMBOLS = "+- "
+
+
+def _format_description(lines):
+    if lines:
+        return textwrap.dedent("\n".join(lines)).strip()
+    return None
 
 
 class TableBuilder:
@@ -10,21 +20,17 @@ class TableBuilder:
         self._data = []
 
     def consume(self, line):
-        table_break_symbols = set("+- ")
-        if set(line) <= table_break_symbols:
+        if not line.strip(_TABLE_BREAK_SYMBOLS):
             return
 
         row = parse_table_line(line, delimiter="|")
         if self._header is None:
-            self._header = row
+            self._header = tuple(map(sys.intern, row))
         else:
             self._data.append(row)
 
     def get_built(self):
-        header = self._header or []
-        return tuple(
-            dict(zip(header, row, strict=False)) for row in self._data
-        )
+        return Table(self._header or (), self._data)
 
 
 class TextBlockBuilder:
@@ -40,7 +46,7 @@ class TextBlockBuilder:
 
 class StepBuilder:
     def __init__(self, sentence):
-        self.sentence = sentence
+        self.sentence = sys.intern(sentence)
         self._builder = None
         self._table = False
         self._text_block = False
@@ -85,17 +91,13 @@ class ScenarioBuilder:
         self._examples_builder.consume(line)
 
     def get_built(self):
-        if self.description:
-            formatted_description = textwrap.dedent(
-                "\n".join(self.description),
-            ).strip()
-        else:
-            formatted_description = None
         return Scenario(
             name=self.name,
-            description=formatted_description,
-            steps=[builder.get_built() for builder in self._step_builders],
-            tags=tuple(self.tags),
+            description=_format_description(self.description),
+            steps=tuple(
+                builder.get_built() for builder in self._step_builders
+            ),
+            tags=tuple(map(sys.intern, self.tags)),
             examples_data=self._examples_builder.get_built(),
         )
 
@@ -113,19 +115,45 @@ class FileBuilder:
     def new_scenario(self, name=None):
         self._scenario_builders.append(ScenarioBuilder(name))
 
-    def get_built(self, *, uri):
-        if self.description:
-            formatted_description = textwrap.dedent(
-                "\n".join(self.description),
-            ).strip()
-        else:
-            formatted_description = None
+    def discard_current_scenario(self):
+        if self._scenario_builders:
+            self._scenario_builders.pop()
 
+    def get_description(self):
+        return _format_description(self.description)
+
+    def get_built(self, *, uri):
         return ParsedFile(
             name=self.name,
-            description=formatted_description,
-            scenarios=[
+            description=self.get_description(),
+            scenarios=tuple(
                 builder.get_built() for builder in self._scenario_builders
-            ],
+            ),
             uri=uri,
         )
+
+
+class StreamingFileBuilder(FileBuilder):
+    """Build scenarios one by one instead of the whole file.
+
+    A scenario is complete as soon as the next one begins
+    (or when `finish` is called). Completed scenarios are moved
+    to `completed` and the builder forgets about them.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.completed = collections.deque()
+        self.header_complete = False
+
+    def new_scenario(self, name=None):
+        self._complete_scenario()
+        super().new_scenario(name)
+
+    def finish(self):
+        self._complete_scenario()
+
+    def _complete_scenario(self):
+        self.header_complete = True
+        if self._scenario_builders:
+            self.completed.append(self._scenario_builders.pop().get_built())
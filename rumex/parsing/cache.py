@@ -0,0 +1,127 @@
+import collections
+import dataclasses
+import hashlib
+import os
+import pathlib
+import pickle
+import tempfile
+import zlib
+
+from rumex import __version__
+
+from .core import InputFile, ParsedFile, ParserProto
+from .parser import parse
+
+_SUFFIX = ".parsed"
+
+
+class CachedParser:
+    """Parser that keeps parsed files in a local directory.
+
+    Entries are keyed by a hash of the text of the file and `version`,
+    so a file is parsed again only if its content changes.
+    Stored files are pickled and compressed.
+
+    Only use directories that are not writable by untrusted parties,
+    since the entries are unpickled.
+
+    Params
+    ------
+    directory: Where to store the entries. Created if it does not exist.
+
+    parser: The parser whose results are cached.
+
+    version:
+        Identifies the parser along with its state machine
+        and tokenizers. Must be changed whenever any of them
+        change, otherwise stale entries will be used.
+
+    max_bytes:
+        Maximum total size of the entries. When exceeded,
+        the least recently used entries are removed.
+    """
+
+    def __init__(
+        self,
+        *,
+        directory: pathlib.Path,
+        parser: ParserProto = parse,
+        version: str = __version__,
+        max_bytes: int = 256 * 2**20,
+    ):
+        self.hits = 0
+        self.misses = 0
+        self._directory = pathlib.Path(directory)
+        self._parser = parser
+        self._version = version
+        self._max_bytes = max_bytes
+
+        self._directory.mkdir(parents=True, exist_ok=True)
+        entries = sorted(
+            (path.stat().st_mtime_ns, path.name, path.stat().st_size)
+            for path in self._directory.glob("*" + _SUFFIX)
+        )
+        self._sizes = collections.OrderedDict(
+            (name, size) for _, name, size in entries
+        )
+        self._total_bytes = sum(self._sizes.values())
+
+    def __call__(self, input_file: InputFile, /) -> ParsedFile:
+        name = self._get_entry_name(input_file.text)
+        parsed = self._load(name)
+        if parsed is None:
+            self.misses += 1
+            parsed = self._parser(input_file)
+            self._store(name, parsed)
+        else:
+            self.hits += 1
+
+        if parsed.uri != input_file.uri:
+            # Different files can have the same content.
+            parsed = dataclasses.replace(parsed, uri=input_file.uri)
+        return parsed
+
+    def _get_entry_name(self, text):
+        hash_ = hashlib.sha256(self._version.encode("utf8") + b"\0")
+        hash_.update(text.encode("utf8"))
+        return hash_.hexdigest() + _SUFFIX
+
+    def _load(self, name):
+        path = self._directory / name
+        try:
+            with path.open("rb") as fio:
+                parsed = pickle.loads(zlib.decompress(fio.read()))  # noqa: S301
+            os.utime(path)
+        except FileNotFoundError:
+            self._forget(name)
+            return None
+        except (OSError, EOFError, zlib.error, pickle.UnpicklingError):
+            self._remove(name)
+            return None
+
+        if name in self._sizes:
+            self._sizes.move_to_end(name)
+        return parsed
+
+    def _store(self, name, parsed):
+        data = zlib.compress(pickle.dumps(parsed, pickle.HIGHEST_PROTOCOL))
+        with tempfile.NamedTemporaryFile(
+            dir=self._directory,
+            delete=False,
+        ) as fio:
+            fio.write(data)
+        # Atomic, so that concurrent readers never see partial entries.
+        pathlib.Path(fio.name).replace(self._directory / name)
+
+        self._forget(name)
+        self._sizes[name] = len(data)
+        self._total_bytes += len(data)
+        while self._total_bytes > self._max_bytes and len(self._sizes) > 1:
+            self._remove(next(iter(self._sizes)))
+
+    def _remove(self, name):
+        self._forget(name)
+        (self._directory / name).unlink(missing_ok=True)
+
+    def _forget(self, name):
+        self._total_bytes -= self._sizes.pop(name, 0)
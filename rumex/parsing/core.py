@@ -2,8 +2,10 @@ from collections.abc import Sequence
 from dataclasses import dataclass
 from typing import Protocol
 
+from .table import Table
 
-@dataclass(frozen=True, kw_only=True)
+
+@dataclass(frozen=True, kw_only=True, slots=True)
 class InputFile:
     """Container for a test file to be parsed.
 
@@ -23,22 +25,22 @@ class InputFile:
     text: str
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class Step:
     sentence: str
-    data: Sequence[dict[str, str]]
+    data: Table | str | None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class Scenario:
     name: str
     description: str | None
     steps: Sequence[Step]
     tags: Sequence[str]
-    examples_data: Sequence[dict[str, str]]
+    examples_data: Table
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class ParsedFile:
     name: str | None
     description: str | None
@@ -0,0 +1,157 @@
+import functools
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass
+from typing import Any
+
+from .builder import FileBuilder
+from .core import InputFile, ParsedFile
+from .parser import (
+    State,
+    StateMachine,
+    _compile,
+    _format_exception_msg,
+    default_state_machine,
+)
+from .tokenizer import (
+    CannotTokenizeLineError,
+    Token,
+    TokenKind,
+    _get_classifier,
+    default_tokenizers,
+)
+
+_UNTOKENIZABLE = object()
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class Diagnostic:
+    """Error found while parsing a file.
+
+    Params
+    ------
+    uri: Identifier of the file.
+
+    line_num: 0-based number of the offending line.
+
+    line: The offending line.
+
+    exception: What went wrong.
+
+    message: Description of the error along with the surrounding lines.
+    """
+
+    uri: str
+    line_num: int
+    line: str
+    exception: Exception
+    message: str
+
+
+def parse_with_diagnostics(  # noqa: PLR0913
+    input_file: InputFile,
+    *,
+    state_machine: StateMachine = default_state_machine,
+    make_builder=FileBuilder,
+    tokenizers=default_tokenizers,
+    resync_state=State.SCENARIO,
+    resync_kinds=(TokenKind.SCENARIO_KW, TokenKind.SCENARIO_TAG),
+) -> tuple[ParsedFile, list[Diagnostic]]:
+    """Parse a file, collecting errors instead of raising them.
+
+    After an error, the scenario being built is discarded
+    and lines are skipped until the next token of one
+    of `resync_kinds`, which is then parsed as if the parser
+    was in `resync_state`.
+
+    Returns
+    -------
+    The file without the broken scenarios and the list of errors.
+
+    """
+    compiled = _compile(state_machine)
+    rows = compiled.rows
+    resync_index = compiled.states.index(resync_state)
+    builder = make_builder()
+    tokens = list(_iter_tokens(input_file.text, tokenizers))
+    diagnostics = []
+
+    state = 0
+    recovering = False
+    for i, token in enumerate(tokens):
+        if recovering:
+            if token.kind not in resync_kinds:
+                continue
+            state = resync_index
+            recovering = False
+
+        try:
+            if token.kind is _UNTOKENIZABLE:
+                raise CannotTokenizeLineError(token.line)  # noqa: TRY301
+            try:
+                state, transition = rows[state][token.kind]
+            except KeyError as exc:
+                msg = f"{compiled.states[state]}, {token}"
+                raise KeyError(msg) from exc
+            transition(builder, token.value)
+        except Exception as exc:  # noqa: BLE001
+            diagnostics.append(
+                Diagnostic(
+                    uri=input_file.uri,
+                    line_num=token.line_num,
+                    line=token.line,
+                    exception=exc,
+                    message=_format_exception_msg(
+                        previous_token=tokens[i - 1] if i else None,
+                        token=token,
+                        next_token=tokens[i + 1]
+                        if i + 1 < len(tokens)
+                        else None,
+                        file_uri=input_file.uri,
+                    )
+                    + repr(exc),
+                ),
+            )
+            builder.discard_current_scenario()
+            recovering = True
+
+    return builder.get_built(uri=input_file.uri), diagnostics
+
+
+def validate_files(
+    files: Iterable[InputFile],
+    *,
+    map_: Callable[..., Iterator[Any]] = map,
+    **kwargs,
+) -> list[Diagnostic]:
+    """Find parsing errors in all of the `files`.
+
+    Params
+    ------
+    files: E.g. the result of `find_input_files`.
+
+    map_:
+        Must have the same interface as the Python's built-in `map`,
+        e.g. `rumex.parallel.ProcessPoolMap`.
+
+    kwargs: Passed to `parse_with_diagnostics`.
+    """
+    return [
+        diagnostic
+        for diagnostics in map_(
+            functools.partial(_get_diagnostics, **kwargs),
+            files,
+        )
+        for diagnostic in diagnostics
+    ]
+
+
+def _get_diagnostics(input_file, **kwargs):
+    _, diagnostics = parse_with_diagnostics(input_file, **kwargs)
+    return diagnostics
+
+
+def _iter_tokens(text, tokenizers):
+    classify = _get_classifier(tokenizers)
+    for i, line in enumerate(text.splitlines()):
+        kind, value = classify(line) or (_UNTOKENIZABLE, None)
+        yield Token(kind=kind, value=value, line=line, line_num=i)
@@ -0,0 +1,147 @@
+import sys
+
+from .builder import FileBuilder
+from .core import InputFile, ParsedFile
+from .parser import StateMachine, _drive, default_state_machine
+from .tokenizer import iter_tokens
+
+
+class LazyScenario:
+    """Scenario whose steps are built when they are first needed.
+
+    Has the same attributes as `Scenario`. `name` and `tags` are
+    known upfront, so scenarios can be selected without building
+    the rest of them. Accessing any other attribute builds
+    the whole scenario from its tokens.
+
+    `line_num` is the 0-based number of the first line
+    of the scenario.
+    """
+
+    def __init__(self, *, name, tags, tokens, state_machine, uri):
+        self.name = name
+        self.tags = tags
+        self.line_num = tokens[0].line_num
+        self._tokens = tokens
+        self._state_machine = state_machine
+        self._uri = uri
+        self._scenario = None
+
+    def __repr__(self):
+        return f"LazyScenario(name={self.name!r}, tags={self.tags!r})"
+
+    @property
+    def description(self):
+        return self._get_scenario().description
+
+    @property
+    def steps(self):
+        return self._get_scenario().steps
+
+    @property
+    def examples_data(self):
+        return self._get_scenario().examples_data
+
+    def _get_scenario(self):
+        if self._scenario is None:
+            builder = FileBuilder()
+            for _ in _drive(
+                iter(self._tokens),
+                state_machine=self._state_machine,
+                builder=builder,
+                file_uri=self._uri,
+            ):
+                pass
+            (self._scenario,) = builder.get_built(uri=self._uri).scenarios
+            self._tokens = None
+        return self._scenario
+
+
+def lazy_parse(
+    input_file: InputFile,
+    *,
+    state_machine: StateMachine = default_state_machine,
+    token_iterator=iter_tokens,
+) -> ParsedFile:
+    """Parse a file, leaving its scenarios to be built on demand.
+
+    Only the file header and the names and tags of the scenarios
+    are built. The rest of each scenario is a span of tokens
+    that is parsed when one of its other attributes is accessed,
+    see `LazyScenario`.
+
+    Errors within a scenario, e.g. malformed tables, are raised
+    only once the scenario is built.
+    """
+    builder = _IndexBuilder()
+    scenario_starts = []
+    tokens = []
+    for token in _drive(
+        token_iterator(input_file.text),
+        state_machine=state_machine,
+        builder=builder,
+        file_uri=input_file.uri,
+    ):
+        if len(builder.scenarios) > len(scenario_starts):
+            scenario_starts.append(len(tokens))
+        tokens.append(token)
+
+    scenario_ends = [*scenario_starts[1:], len(tokens)]
+    return ParsedFile(
+        name=builder.name,
+        description=builder.get_description(),
+        scenarios=[
+            LazyScenario(
+                name=scenario.name,
+                tags=tuple(map(sys.intern, scenario.tags)),
+                tokens=tokens[start:end],
+                state_machine=state_machine,
+                uri=input_file.uri,
+            )
+            for scenario, start, end in zip(
+                builder.scenarios,
+                scenario_starts,
+                scenario_ends,
+                strict=True,
+            )
+        ],
+        uri=input_file.uri,
+    )
+
+
+class _Ignored:
+    """Accepts and discards any content of a scenario."""
+
+    def append(self, _):
+        pass
+
+    def add_step_data(self, _):
+        pass
+
+    def add_text_block_line(self, _):
+        pass
+
+
+class _ScenarioIndexBuilder:
+    def __init__(self, name):
+        self.name = name
+        self.tags = []
+        self.description = _Ignored()
+        self.current_step_builder = _Ignored()
+
+    def new_step(self, *_, **__):
+        pass
+
+    def add_example(self, _):
+        pass
+
+
+class _IndexBuilder(FileBuilder):
+    """Builds the file header and only names and tags of scenarios."""
+
+    def __init__(self):
+        super().__init__()
+        self.scenarios = self._scenario_builders
+
+    def new_scenario(self, name=None):
+        self._scenario_builders.append(_ScenarioIndexBuilder(name))
@@ -1,10 +1,12 @@
-from collections.abc import Mapping
+import collections
+import io
+from collections.abc import Iterable, Mapping
 from enum import Enum, auto
 from typing import Protocol
 
-from .builder import FileBuilder
+from .builder import FileBuilder, StreamingFileBuilder
 from .core import InputFile, ParsedFile
-from .tokenizer import TokenKind, iter_tokens
+from .tokenizer import TokenKind, iter_line_tokens, iter_tokens
 
 
 class CannotParseLineError(Exception):
@@ -54,6 +56,17 @@ class StateMachine(Mapping):
 
     def __init__(self, transitions):
         self._transitions = transitions
+        self._compiled = None
+
+    def compile(self):
+        """Get the transition table used by `parse`.
+
+        The table is built once and then reused, so the transitions
+        should not be modified after the first call.
+        """
+        if self._compiled is None:
+            self._compiled = CompiledStateMachine(self)
+        return self._compiled
 
     def __getitem__(self, item):
         return self._transitions[item]
@@ -65,6 +78,41 @@ class StateMachine(Mapping):
         return len(self._transitions)
 
 
+class CompiledStateMachine:
+    """State machine turned into an integer-indexed transition table.
+
+    States are numbered in the order of appearance, with the start
+    state being `0`. `rows[i]` holds the transitions of `states[i]`
+    as a map from token kind to a 2-tuple
+    of (next state index, builder callback).
+
+    States that are referenced but have no transitions of their own
+    get empty rows, so that reaching them fails the same way
+    as with the original map.
+    """
+
+    def __init__(self, state_machine, *, start=State.START):
+        index = {start: 0}
+        for state, transitions in state_machine.items():
+            index.setdefault(state, len(index))
+            for next_state, _ in transitions.values():
+                index.setdefault(next_state, len(index))
+
+        self.states = tuple(index)
+        self.rows = [{} for _ in self.states]
+        for state, transitions in state_machine.items():
+            self.rows[index[state]] = {
+                kind: (index[next_state], callback)
+                for kind, (next_state, callback) in transitions.items()
+            }
+
+
+def _compile(state_machine):
+    if isinstance(state_machine, StateMachine):
+        return state_machine.compile()
+    return CompiledStateMachine(state_machine)
+
+
 def new_scenario_from_name(builder, scenario_name):
     builder.new_scenario(scenario_name)
 
@@ -251,16 +299,31 @@ def parse(
     token_iterator=iter_tokens,
 ) -> ParsedFile:
     """Text in, object out."""
-    state = State.START
     builder = make_builder()
+    collections.deque(
+        _drive(
+            token_iterator(input_file.text),
+            state_machine=state_machine,
+            builder=builder,
+            file_uri=input_file.uri,
+        ),
+        maxlen=0,
+    )
+    return builder.get_built(uri=input_file.uri)
+
+
+def _drive(tokens, *, state_machine, builder, file_uri):
+    """Feed `tokens` to the `builder`, yielding each consumed token."""
+    compiled = _compile(state_machine)
+    rows = compiled.rows
+    state = 0
 
     previous_token = None
-    tokens = token_iterator(input_file.text)
     for token in tokens:
         try:
-            state, transition = state_machine[state][token.kind]
+            state, transition = rows[state][token.kind]
         except KeyError as exc:
-            raise KeyError(f"{state}, {token}") from exc
+            raise KeyError(f"{compiled.states[state]}, {token}") from exc
         try:
             transition(builder, token.value)
         except Exception as exc:
@@ -268,26 +331,125 @@ def parse(
                 previous_token=previous_token,
                 token=token,
                 tokens=tokens,
-                file_uri=input_file.uri,
+                file_uri=file_uri,
             )
             raise CannotParseLineError(exc_msg) from exc
         previous_token = token
+        yield token
 
-    return builder.get_built(uri=input_file.uri)
+
+class StreamedFile:
+    """Parsed file whose scenarios are built as they are iterated over.
+
+    Can be used in place of `ParsedFile`, e.g. by `execute_file`,
+    with the exception that `scenarios` can be iterated over
+    only once.
+
+    `name` and `description` are complete once the first scenario
+    begins. Accessing them earlier parses the file up to that point.
+    """
+
+    def __init__(self, steps, *, builder, uri):
+        self.uri = uri
+        self._steps = steps
+        self._builder = builder
+        self._finished = False
+
+    @property
+    def name(self):
+        self._complete_header()
+        return self._builder.name
+
+    @property
+    def description(self):
+        self._complete_header()
+        return self._builder.get_description()
+
+    @property
+    def scenarios(self):
+        return self._iter_scenarios()
+
+    def _complete_header(self):
+        while not self._builder.header_complete and self._advance():
+            pass
+
+    def _iter_scenarios(self):
+        completed = self._builder.completed
+        while completed or self._advance():
+            while completed:
+                yield completed.popleft()
+
+    def _advance(self):
+        """Consume a single token, return `False` if there are none."""
+        if self._finished:
+            return False
+        try:
+            next(self._steps)
+        except StopIteration:
+            self._finished = True
+            self._builder.finish()
+        return True
+
+
+def iter_parse(
+    lines: Iterable[str],
+    *,
+    uri: str,
+    state_machine: StateMachine = default_state_machine,
+    make_builder=StreamingFileBuilder,
+    token_iterator=iter_line_tokens,
+) -> StreamedFile:
+    """Lines in, scenarios out as soon as each one is complete.
+
+    Params
+    ------
+    lines: E.g. an open text file.
+
+    uri: Identifier of the parsed file.
+
+    make_builder:
+        Must return an object with the same interface
+        as `StreamingFileBuilder`.
+
+    token_iterator:
+        Must take an iterable of lines, see `iter_line_tokens`.
+    """
+    builder = make_builder()
+    steps = _drive(
+        token_iterator(lines),
+        state_machine=state_machine,
+        builder=builder,
+        file_uri=uri,
+    )
+    return StreamedFile(steps, builder=builder, uri=uri)
+
+
+def stream_parse(input_file: InputFile) -> StreamedFile:
+    """Parse like `iter_parse`, but take an `InputFile` argument."""
+    return iter_parse(io.StringIO(input_file.text), uri=input_file.uri)
 
 
 def _get_exception_msg(*, previous_token, token, tokens, file_uri):
+    try:
+        next_token = next(tokens)
+    except StopIteration:
+        next_token = None
+    return _format_exception_msg(
+        previous_token=previous_token,
+        token=token,
+        next_token=next_token,
+        file_uri=file_uri,
+    )
+
+
+def _format_exception_msg(*, previous_token, token, next_token, file_uri):
     line_num = token.line_num + 1  # it's 0-based but we want to report 1-based
 
     context = []
     if previous_token is not None:
         context.append((f"{line_num - 1}: ", previous_token.line))
     context.append((f"ERR> {line_num}: ", token.line))
-    try:
-        next_token = next(tokens)
-    except StopIteration:
-        pass
-    else:
+    if next_token is not None:
         context.append((f"{line_num + 1}: ", next_token.line))
 
     max_prefix_len = max(
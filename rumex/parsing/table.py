@@ -1,3 +1,6 @@
+from collections.abc import Sequence
+
+
 class TableExceptionError(Exception):
     pass
 
@@ -10,6 +13,85 @@ class InconsistentTableError(TableExceptionError):
     pass
 
 
+class Table(Sequence):
+    """Table whose rows share a single header.
+
+    Behaves like a sequence of `dict`s mapping column names
+    to values, but stores only tuples and creates the `dict`s
+    on access. Code processing whole tables can skip creating
+    them by using `header`, `rows` and `column` instead.
+
+    Two `Table`s are equal if their headers and rows are equal.
+    A `Table` is equal to any other sequence of the same `dict`s.
+    """
+
+    __slots__ = ("header", "rows")
+
+    def __init__(self, header=(), rows=()):
+        self.header = tuple(header)
+        self.rows = tuple(map(tuple, rows))
+
+    def __repr__(self):
+        return f"Table(header={self.header!r}, rows={self.rows!r})"
+
+    def __len__(self):
+        return len(self.rows)
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return Table(self.header, self.rows[item])
+        return dict(zip(self.header, self.rows[item], strict=False))
+
+    def __iter__(self):
+        header = self.header
+        for row in self.rows:
+            yield dict(zip(header, row, strict=False))
+
+    def __eq__(self, other):
+        if isinstance(other, Table):
+            return self.header == other.header and self.rows == other.rows
+        if isinstance(other, Sequence) and not isinstance(other, str):
+            return len(self) == len(other) and all(
+                row == other_row
+                for row, other_row in zip(self, other, strict=True)
+            )
+        return NotImplemented
+
+    def __hash__(self):
+        return hash((self.header, self.rows))
+
+    def __getstate__(self):
+        return self.header, self.rows
+
+    def __setstate__(self, state):
+        self.header, self.rows = state
+
+    def column(self, name):
+        """Get all values of a column as a tuple.
+
+        Raises
+        ------
+        KeyError: If there is no such column.
+
+        InconsistentTableError:
+            If some rows do not have a value in the column.
+
+        """
+        # Search from the end, so that duplicated names
+        # resolve the same way as in the `dict` rows.
+        try:
+            index = len(self.header) - 1 - self.header[::-1].index(name)
+        except ValueError:
+            raise KeyError(name) from None
+        try:
+            return tuple(row[index] for row in self.rows)
+        except IndexError:
+            raise InconsistentTableError(name) from None
+
+
+_ESCAPE_SYMBOL = "\\"
+
+
 def parse_table_line(line, *, delimiter):
     line = line.strip()
 
@@ -20,9 +102,36 @@ def parse_table_line(line, *, delimiter):
     ):
         raise BadTableLineError(line)
 
-    line = line[1:]
+    if _ESCAPE_SYMBOL not in line:
+        return tuple(map(str.strip, line[1:-1].split(delimiter)))
+
+    return _parse_escaped(line[1:], delimiter=delimiter)
+
+
+def parse_table_lines(lines, *, delimiter):
+    """Parse a block of table lines at once.
+
+    Equivalent to calling `parse_table_line` for each line,
+    but faster for large tables.
+    """
+    rows = []
+    append = rows.append
+    strip = str.strip
+    for raw_line in lines:
+        line = raw_line.strip()
+        if (
+            _ESCAPE_SYMBOL in line
+            or len(line) < 2  # noqa: PLR2004
+            or line[0] != delimiter
+            or line[-1] != delimiter
+        ):
+            append(parse_table_line(line, delimiter=delimiter))
+        else:
+            append(tuple(map(strip, line[1:-1].split(delimiter))))
+    return tuple(rows)
+
 
-    escape_symbol = "\\"
+def _parse_escaped(line, *, delimiter):
     values = []
     current_value = []
     escape_next_symbol = False
@@ -33,7 +142,7 @@ def parse_table_line(line, *, delimiter):
         elif symbol == delimiter:
             values.append("".join(current_value).strip())
             current_value = []
-        elif symbol == escape_symbol:
+        elif symbol == _ESCAPE_SYMBOL:
             escape_next_symbol = True
         else:
             current_value.append(symbol)
@@ -1,3 +1,5 @@
+import functools
+import itertools
 import re
 from collections.abc import Hashable, Sequence
 from dataclasses import dataclass
@@ -32,59 +34,172 @@ class Token:
     line_num: int
 
 
+@functools.lru_cache(maxsize=64)
+def _keyword_pattern(keyword):
+    return re.compile(rf"^\s*{keyword}:\s*(.*)$")
+
+
 def match_keyword(keyword, *, line):
-    if match_ := re.match(rf"^\s*{keyword}:\s*(.*)$", line):
+    if match_ := _keyword_pattern(keyword).match(line):
         (value,) = match_.groups()
         return value
     return None
 
 
-def match_scenario_tag(line):
-    if match_ := re.match(r"^\s*@(\w+)\s*$", line):
-        (tag,) = match_.groups()
-        return TokenKind.SCENARIO_TAG, tag
-    return None
+class RegexTokenizer:
+    """Tokenizer defined by a regular expression.
 
+    Can be used in place of a tokenizer function, but unlike
+    a function, it can be merged with other `RegexTokenizer`s
+    into a single pattern (see `compile_tokenizers`).
 
-def match_scenario(line):
-    if name := match_keyword("Scenario", line=line):
-        return TokenKind.SCENARIO_KW, name
-    return None
+    Params
+    ------
+    kind: Kind of the produced token.
 
+    pattern:
+        Regex applied with `re.match` to a line. It may contain
+        at most one capturing group and no backreferences.
 
-def match_name(line):
-    if name := match_keyword("Name", line=line):
-        return TokenKind.NAME_KW, name
-    return None
+    value_is_line:
+        If `True`, the whole line becomes the token value.
+        Otherwise the value is the content of the capturing group
+        or `None` if the pattern has no groups.
+    """
 
+    def __init__(self, kind, pattern, *, value_is_line=False):
+        self.kind = kind
+        self.pattern = pattern
+        self.value_is_line = value_is_line
+        self._compiled = re.compile(pattern)
+        if self._compiled.groups > 1:
+            raise ValueError(f"Too many groups in {pattern!r}.")
 
-def match_examples(line):
-    if re.match(r"^\s*Examples:\s*$", line):
-        return TokenKind.EXAMPLES, None
-    return None
+    def __repr__(self):
+        return f"RegexTokenizer({self.kind}, {self.pattern!r})"
+
+    @property
+    def groups(self):
+        return self._compiled.groups
+
+    def __call__(self, line):
+        if match_ := self._compiled.match(line):
+            return self.kind, self.get_value(match_, 1, line)
+        return None
+
+    def get_value(self, match_, group, line):
+        if self.value_is_line:
+            return line
+        if self.groups:
+            return match_.group(group)
+        return None
+
+
+# Note that a keyword followed only by whitespace is not a match:
+# `\S` after the greedy `\s*` requires a non-empty value
+# and `.*\S` requires something after the step keyword.
+match_triple_quote = RegexTokenizer(
+    TokenKind.TRIPLE_QUOTE,
+    r'\s*"""\s*$',
+)
+match_name = RegexTokenizer(TokenKind.NAME_KW, r"\s*Name:\s*(\S.*)$")
+match_scenario_tag = RegexTokenizer(
+    TokenKind.SCENARIO_TAG,
+    r"\s*@(\w+)\s*$",
+)
+match_scenario = RegexTokenizer(
+    TokenKind.SCENARIO_KW,
+    r"\s*Scenario:\s*(\S.*)$",
+)
+match_step = RegexTokenizer(
+    TokenKind.STEP_KW,
+    r"\s*(?:Given|When|Then|And) .*\S",
+    value_is_line=True,
+)
+match_examples = RegexTokenizer(TokenKind.EXAMPLES, r"\s*Examples:\s*$")
+match_blank_line = RegexTokenizer(
+    TokenKind.BLANK_LINE,
+    r"\s*$",
+    value_is_line=True,
+)
+match_description = RegexTokenizer(
+    TokenKind.DESCRIPTION,
+    r".*",
+    value_is_line=True,
+)
 
 
-def match_triple_quote(line):
-    if line.strip() == '"""':
-        return TokenKind.TRIPLE_QUOTE, None
-    return None
+class _MergedTokenizers:
+    """Consecutive `RegexTokenizer`s matched by one alternation.
 
+    Alternatives of a regex are tried left to right, so the first
+    tokenizer to match wins, exactly as in a chain of calls.
+    """
 
-def match_step(line):
-    stripped = line.strip()
-    if stripped.startswith(("Given ", "When ", "Then ", "And ")):
-        return TokenKind.STEP_KW, line
-    return None
+    def __init__(self, tokenizers):
+        alternatives = []
+        self._by_group = {}
+        group = 1
+        for tokenizer in tokenizers:
+            alternatives.append(f"({tokenizer.pattern})")
+            self._by_group[group] = tokenizer
+            group += 1 + tokenizer.groups
+        self._pattern = re.compile("|".join(alternatives))
+
+    def __call__(self, line):
+        if match_ := self._pattern.match(line):
+            group = match_.lastindex
+            tokenizer = self._by_group[group]
+            return tokenizer.kind, tokenizer.get_value(match_, group + 1, line)
+        return None
+
+
+def compile_tokenizers(tokenizers):
+    """Turn a sequence of tokenizers into a single line classifier.
+
+    Runs of `RegexTokenizer`s are merged into one precompiled
+    pattern, so that a line is classified with a single regex match.
+    Any other tokenizer functions are called as they are,
+    in their original order.
+
+    Returns
+    -------
+    A function that takes a line and returns a 2-tuple of
+    (token kind, value) or `None`, just like a single tokenizer.
+
+    """
+    groups = []
+    for is_regex, group in itertools.groupby(
+        tokenizers,
+        key=lambda tokenizer: isinstance(tokenizer, RegexTokenizer),
+    ):
+        if is_regex:
+            groups.append(_MergedTokenizers(group))
+        else:
+            groups.extend(group)
 
+    if len(groups) == 1:
+        return groups[0]
+
+    def classify(line):
+        for tokenizer in groups:
+            if kind_and_value := tokenizer(line):
+                return kind_and_value
+        return None
+
+    return classify
 
-def match_blank_line(line):
-    if not line.strip():
-        return TokenKind.BLANK_LINE, line
-    return None
 
+@functools.lru_cache(maxsize=64)
+def _compile_cached(tokenizers):
+    return compile_tokenizers(tokenizers)
 
-def match_description(line):
-    return TokenKind.DESCRIPTION, line
+
+def _get_classifier(tokenizers):
+    try:
+        return _compile_cached(tokenizers)
+    except TypeError:  # unhashable, e.g. a list
+        return compile_tokenizers(tokenizers)
 
 
 class Tokenizers(Sequence):
@@ -94,7 +209,7 @@ class Tokenizers(Sequence):
         self._fns = fns
 
     def __repr__(self):
-        return f'Tokenizers({", ".join(self._fns)})'
+        return f"Tokenizers({', '.join(map(repr, self._fns))})"
 
     def __getitem__(self, item):
         return self._fns[item]
@@ -116,16 +231,32 @@ default_tokenizers = Tokenizers(
 
 
 def iter_tokens(text, tokenizers=default_tokenizers):
-    for i, line in enumerate(text.splitlines()):
-        for tokenizer in tokenizers:
-            if kind_and_value := tokenizer(line):
-                token_kind, value = kind_and_value
-                yield Token(
-                    kind=token_kind,
-                    value=value,
-                    line=line,
-                    line_num=i,
-                )
-                break
+    return _iter_tokens(text.splitlines(), tokenizers)
+
+
+def iter_line_tokens(lines, tokenizers=default_tokenizers):
+    """Tokenize an iterable of lines, e.g. an open text file.
+
+    Line breaks are handled the same way as `str.splitlines` would
+    handle them for the whole text, so the tokens are identical
+    to the ones `iter_tokens` produces for the joined lines.
+    """
+    return _iter_tokens(
+        (line for chunk in lines for line in chunk.splitlines() or [chunk]),
+        tokenizers,
+    )
+
+
+def _iter_tokens(lines, tokenizers):
+    classify = _get_classifier(tokenizers)
+    for i, line in enumerate(lines):
+        if kind_and_value := classify(line):
+            token_kind, value = kind_and_value
+            yield Token(
+                kind=token_kind,
+                value=value,
+                line=line,
+                line_num=i,
+            )
         else:
             raise CannotTokenizeLineError(line)
@@ -1,11 +1,16 @@
+import collections
+import functools
 import inspect
 import re
 from collections.abc import Callable, Iterable, Sequence
 from dataclasses import dataclass
+from re import _constants as sre_constants  # type: ignore[attr-defined]
+from re import _parser as sre_parser  # type: ignore[attr-defined]
 from typing import Any, Protocol, TypeAlias
 
 from .parsing.core import InputFile, ParsedFile, ParserProto, Scenario
 from .parsing.parser import parse
+from .templates import compile_line, compile_step_data
 
 
 class RumexError(Exception):
@@ -20,29 +25,31 @@ class MatchingFunctionNotFoundError(RumexError):
     pass
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class _ExecutedStep:
     sentence: str
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class FailedStep(_ExecutedStep):
     exception: Exception
     success = False
 
 
 class PassedStep(_ExecutedStep):
+    __slots__ = ()
     success = True
 
 
 class IgnoredStep(_ExecutedStep):
+    __slots__ = ()
     success = False
 
 
 ExecutedStep: TypeAlias = FailedStep | PassedStep | IgnoredStep  # noqa: UP040
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class ExecutedScenario:
     name: str
     description: str
@@ -52,39 +59,46 @@ class ExecutedScenario:
 
 
 class PassedScenario(ExecutedScenario):
+    __slots__ = ()
     success = True
 
 
 class SkippedScenario(PassedScenario):
-    pass
+    __slots__ = ()
 
 
 class FailedScenario(ExecutedScenario):
+    __slots__ = ()
     success = False
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class ExecutedFile:
     scenarios: tuple[ExecutedScenario, ...]
     uri: str
     name: str | None
     description: str | None
 
-    def __new__(cls, *, scenarios, **_):
+    def __new__(cls, *, scenarios=None, **_):
+        # `super()` cannot be used in slotted dataclasses.
+        if scenarios is None:  # Unpickling.
+            return object.__new__(cls)
         if all(s.success for s in scenarios):
-            return super().__new__(PassedFile)
-        return super().__new__(FailedFile)
+            return object.__new__(PassedFile)
+        return object.__new__(FailedFile)
 
 
 class PassedFile(ExecutedFile):
+    __slots__ = ()
     success = True
 
 
 class FailedFile(ExecutedFile):
+    __slots__ = ()
     success = False
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class _Hook:
     name: str
     fn: Callable[[Any], None]
@@ -110,6 +124,122 @@ class _Hooks:
             raise HookAlreadyRegisteredError(hook_name)
 
 
+_WORD = re.compile(r"\w+")
+_WORD_BOUNDARIES = frozenset(
+    {
+        sre_constants.AT_BEGINNING,
+        sre_constants.AT_BEGINNING_STRING,
+        sre_constants.AT_BOUNDARY,
+        sre_constants.AT_END,
+        sre_constants.AT_END_STRING,
+    },
+)
+
+
+def _get_required_words(pattern: re.Pattern) -> set[str]:
+    """Find words that every string matched by `pattern` contains.
+
+    Only words spelled out by literals and delimited
+    by non-word literals, anchors or word boundaries are found.
+    Patterns with flags are not analysed.
+    """
+    if pattern.flags & ~re.UNICODE:
+        return set()
+    try:
+        parsed = sre_parser.parse(pattern.pattern)
+    except Exception:  # noqa: BLE001
+        return set()
+
+    words = set()
+    run_ = []
+    for op, arg in [*parsed, (None, None)]:
+        if op is sre_constants.LITERAL:
+            run_.append(chr(arg))
+        elif op is sre_constants.AT and arg in _WORD_BOUNDARIES:
+            run_.append(" ")
+        else:
+            text = "".join(run_)
+            words.update(
+                match_[0]
+                for match_ in _WORD.finditer(text)
+                if match_.start() > 0 and match_.end() < len(text)
+            )
+            run_ = []
+    return words
+
+
+class _StepIndex:
+    """Find the first registered pattern that matches a sentence.
+
+    Each pattern is put in the bucket of one of its required
+    words, so only patterns whose word is in the sentence are
+    searched. Patterns without required words are always searched.
+    """
+
+    def __init__(self):
+        self._patterns = []
+        self._buckets = collections.defaultdict(list)
+        self._unindexed = []
+
+    def add(self, pattern):
+        position = len(self._patterns)
+        self._patterns.append(pattern)
+        if words := _get_required_words(pattern):
+            word = min(
+                words,
+                key=lambda w: (len(self._buckets.get(w, ())), -len(w), w),
+            )
+            self._buckets[word].append(position)
+        else:
+            self._unindexed.append(position)
+
+    def search(self, sentence):
+        candidates = self._unindexed.copy()
+        for word in set(_WORD.findall(sentence)):
+            candidates.extend(self._buckets.get(word, ()))
+        for position in sorted(candidates):
+            if match_ := self._patterns[position].search(sentence):
+                return match_
+        return None
+
+
+class _StepAdapter:
+    """Call a step function the way its signature asks for.
+
+    The function is inspected once. Captured groups are passed
+    positionally, converted by the annotations of the corresponding
+    parameters. `data` and `context` are passed only if the function
+    has keyword-only parameters with these names.
+    """
+
+    def __init__(self, fn):
+        spec = inspect.getfullargspec(fn)
+        self._fn = fn
+        self._converters = tuple(
+            spec.annotations.get(name, _identity) for name in spec.args
+        )
+        self._pass_data = "data" in spec.kwonlyargs
+        self._pass_context = "context" in spec.kwonlyargs
+
+    def bind(self, args, *, data):
+        fn = self._fn
+        mapped_args = [
+            convert(value)
+            for convert, value in zip(self._converters, args, strict=False)
+        ]
+        if self._pass_data and self._pass_context:
+            return lambda context: fn(*mapped_args, data=data, context=context)
+        if self._pass_data:
+            return lambda context: fn(*mapped_args, data=data)  # noqa: ARG005
+        if self._pass_context:
+            return lambda context: fn(*mapped_args, context=context)
+        return lambda context: fn(*mapped_args)  # noqa: ARG005
+
+
+def _identity(value):
+    return value
+
+
 class ContextCallable(Protocol):
     def __call__(self, context: Any) -> None: ...
 
@@ -123,7 +253,7 @@ class ExecutableStep:
         self._callable(context=context)
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class MissingStep:
     sentence: str
 
@@ -289,6 +419,7 @@ def run(  # noqa: PLR0913
     executor: ExecutorProto = execute_file,
     reporter=report,
     map_=map,
+    parser_map=None,
 ):
     """Entry point for running tests.
 
@@ -318,11 +449,15 @@ def run(  # noqa: PLR0913
         Must have the same interface as the Python's built-in `map`.
         Custom implementation might be used to speed up
         file parsing or execution.
+
+    parser_map:
+        Same as `map_`, but used only for parsing.
+        Defaults to `map_`.
     """
-    parsed_files = map_(parser, files)
+    parsed_files = (parser_map or map_)(parser, files)
     executed = map_(
-        lambda parsed_file: executor(
-            parsed_file,
+        functools.partial(
+            executor,
             steps=steps,
             context_maker=context_maker,
         ),
@@ -332,11 +467,36 @@ def run(  # noqa: PLR0913
 
 
 class StepMapper:
-    """Prepare step functions."""
+    """Prepare step functions.
 
-    def __init__(self):
+    Params
+    ------
+    cache_size:
+        How many sentences to remember the matching
+        step function of. `None` means no limit.
+    """
+
+    def __init__(self, *, cache_size: int | None = 4096):
         self._hooks = _Hooks()
         self._pattern_to_fn = {}
+        self._index = _StepIndex()
+        self._cache_size = cache_size
+        self._resolve = self._make_cache()
+
+    def __getstate__(self):
+        # The cache is bound to this instance and cannot be pickled.
+        state = self.__dict__.copy()
+        del state["_resolve"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._resolve = self._make_cache()
+
+    def _make_cache(self):
+        return functools.lru_cache(maxsize=self._cache_size)(
+            self._resolve_uncached,
+        )
 
     def before_scenario(self, callable_: ContextCallable, /):
         """Register a function to execute at the start of each scenario.
@@ -401,35 +561,35 @@ class StepMapper:
         return lambda fn: self._add_step_fn(fn, pattern=pattern)
 
     def _add_step_fn(self, fn, /, *, pattern):
-        self._pattern_to_fn[re.compile(pattern)] = fn
+        compiled = re.compile(pattern)
+        if compiled not in self._pattern_to_fn:
+            self._index.add(compiled)
+        self._pattern_to_fn[compiled] = _StepAdapter(fn)
+        self._resolve.cache_clear()
         return fn
 
-    def _wrap_mapped_function(self, *, fn_spec, fn, mapped_args, data):
-        def wrapped(context):
-            kwargs = {}
-            if "data" in fn_spec.kwonlyargs:
-                kwargs["data"] = data
-            if "context" in fn_spec.kwonlyargs:
-                kwargs["context"] = context
-            return fn(*mapped_args, **kwargs)
+    def cache_info(self):
+        """Get statistics of the cache of matched sentences.
+
+        The cache is cleared whenever a step is registered.
 
-        return wrapped
+        Returns
+        -------
+        Named tuple with `hits`, `misses`, `maxsize` and `currsize`,
+        see `functools.lru_cache`.
+
+        """
+        return self._resolve.cache_info()
+
+    def _resolve_uncached(self, sentence):
+        if match_ := self._index.search(sentence):
+            return self._pattern_to_fn[match_.re], match_.groups()
+        return None
 
     def _prepare_step(self, *, sentence, data):
-        for pattern, fn in self._pattern_to_fn.items():
-            if match_ := pattern.search(sentence):
-                args = match_.groups()
-                spec = inspect.getfullargspec(fn)
-                mapped_args = [
-                    spec.annotations.get(name, lambda x: x)(value)
-                    for name, value in zip(spec.args, args, strict=False)
-                ]
-                return self._wrap_mapped_function(
-                    fn_spec=spec,
-                    fn=fn,
-                    mapped_args=mapped_args,
-                    data=data,
-                )
+        if resolved := self._resolve(sentence):
+            adapter, args = resolved
+            return adapter.bind(args, data=data)
 
         return None
 
@@ -438,23 +598,25 @@ class StepMapper:
         scenario: Scenario,
     ) -> Iterable[ExecutableStep | MissingStep]:
         """See documentation of `StepMapperProto`."""
+        templates = [
+            (compile_line(step_.sentence), compile_step_data(step_.data))
+            for step_ in scenario.steps
+        ]
         for example_data in scenario.examples_data or [{}]:
-            yield self._iter_steps(scenario, example_data=example_data)
+            yield self._iter_steps(templates, example_data=example_data)
 
-    def _iter_steps(self, scenario, example_data):
+    def _iter_steps(self, templates, example_data):
         if hook := self._hooks.run_before_scenario:
             yield ExecutableStep(sentence=hook.name, callable_=hook.fn)
-        for step_ in scenario.steps:
+        for sentence_template, data_template in templates:
             if hook := self._hooks.run_before_step:
                 yield ExecutableStep(sentence=hook.name, callable_=hook.fn)
 
-            sentence = self._evaluate_sentence(
-                template=step_.sentence,
-                example_data=example_data,
-            )
-            data = self._evaluate_step_data(
-                template=step_.data,
-                example_data=example_data,
+            sentence = sentence_template.expand(example_data)
+            data = (
+                None
+                if data_template is None
+                else data_template.expand(example_data)
             )
 
             callable_ = self._prepare_step(sentence=sentence, data=data)
@@ -463,58 +625,3 @@ class StepMapper:
                 yield ExecutableStep(sentence=sentence, callable_=callable_)
             else:
                 yield MissingStep(sentence=sentence)
-
-    def _evaluate_sentence(self, *, template, example_data):
-        return self._evaluate_line(
-            template=template,
-            example_data=example_data,
-        )
-
-    def _evaluate_line(self, template: str, *, example_data) -> str:
-        pattern = re.compile(r"(?:^|[^\\])(?:\\\\)*(<(\w+)>)")
-        line = template
-        while match_ := re.search(pattern, line):
-            _, end = match_.span()
-            outer, key = match_.groups()
-            start = end - len(outer)
-            value = example_data[key]
-            line = line[:start] + value + line[end:]
-        return line
-
-    def _evaluate_step_data(self, *, template, example_data):
-        if template is None:
-            return template
-
-        if isinstance(template, str):
-            return self._evaluate_step_text(
-                template,
-                example_data=example_data,
-            )
-
-        return self._evaluate_step_data_table(
-            template,
-            example_data=example_data,
-        )
-
-    def _evaluate_step_text(self, template, *, example_data):
-        return "\n".join(
-            self._evaluate_line(line, example_data=example_data)
-            for line in template.splitlines()
-        )
-
-    def _evaluate_step_data_table(
-        self,
-        table_template: Sequence[dict[str, str]],
-        *,
-        example_data,
-    ) -> tuple[dict[str, str], ...]:
-        return tuple(
-            {
-                self._evaluate_line(
-                    key,
-                    example_data=example_data,
-                ): self._evaluate_line(value, example_data=example_data)
-                for key, value in row.items()
-            }
-            for row in table_template
-        )
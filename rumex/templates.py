@@ -0,0 +1,179 @@
+"""Expansion of `<placeholders>` in steps of scenarios with examples.
+
+Each sentence, text block and table of a scenario is compiled once
+into literals and keys, so that expanding it for an example row
+is a single string formatting operation.
+"""
+
+import functools
+import re
+from collections.abc import Mapping, Sequence
+
+from .parsing.table import Table
+
+# A placeholder is replaced unless it is escaped by an odd number
+# of backslashes.
+_PLACEHOLDER = re.compile(r"(?<!\\)((?:\\\\)*)<(\w+)>")
+
+
+class LineTemplate:
+    """Line of text with placeholders.
+
+    `keys` are the names of the placeholders in the order
+    in which they appear. Lines without them are never copied.
+    """
+
+    __slots__ = ("_format", "_is_simple", "keys", "text")
+
+    def __init__(self, text: str):
+        literals = []
+        keys = []
+        position = 0
+        for match_ in _PLACEHOLDER.finditer(text):
+            literals.append(text[position : match_.end(1)])
+            keys.append(match_[2])
+            position = match_.end()
+        literals.append(text[position:])
+
+        self.text = text
+        self.keys = tuple(keys)
+        # Values are substituted into literals containing "<"
+        # one by one, since they may form new placeholders.
+        self._is_simple = not any("<" in literal for literal in literals)
+        self._format = "".join(
+            f"{_escape_braces(literal)}{{{i}}}"
+            for i, literal in enumerate(literals[:-1])
+        ) + _escape_braces(literals[-1])
+
+    def expand(self, example_data: Mapping[str, str]) -> str:
+        if not self.keys:
+            return self.text
+
+        values = [example_data[key] for key in self.keys]
+        if self._is_simple and not any(
+            "<" in value or "\\" in value for value in values
+        ):
+            return self._format.format(*values)
+        return _expand_one_by_one(self.text, example_data=example_data)
+
+
+compile_line = functools.lru_cache(maxsize=2**14)(LineTemplate)
+
+
+class TextTemplate:
+    """Text block with placeholders."""
+
+    __slots__ = ("_lines", "_text", "keys")
+
+    def __init__(self, text: str):
+        self._lines = tuple(map(compile_line, text.splitlines()))
+        self.keys = tuple(key for line in self._lines for key in line.keys)
+        self._text = "\n".join(line.text for line in self._lines)
+
+    def expand(self, example_data: Mapping[str, str]) -> str:
+        if not self.keys:
+            return self._text
+        return "\n".join(line.expand(example_data) for line in self._lines)
+
+
+class TableTemplate:
+    """Table with placeholders in its header or cells.
+
+    Rows are truncated to the length of the header.
+    """
+
+    __slots__ = ("_header", "_rows", "_table", "keys")
+
+    def __init__(self, table: Table):
+        self._header = tuple(map(compile_line, table.header))
+        self._rows = tuple(
+            tuple(map(compile_line, row[: len(self._header)]))
+            for row in table.rows
+        )
+        self.keys = tuple(
+            key
+            for row in (self._header, *self._rows)
+            for cell in row
+            for key in cell.keys
+        )
+        self._table = None if self.keys else self._expand({})
+
+    def expand(self, example_data: Mapping[str, str]) -> Table:
+        if self._table is None:
+            return self._expand(example_data)
+        return self._table
+
+    def _expand(self, example_data):
+        return Table(
+            [cell.expand(example_data) for cell in self._header],
+            [
+                [cell.expand(example_data) for cell in row]
+                for row in self._rows
+            ],
+        )
+
+
+class RowsTemplate:
+    """Table given as a sequence of dictionaries.
+
+    Each expansion creates new dictionaries.
+    """
+
+    __slots__ = ("_rows", "keys")
+
+    def __init__(self, rows: Sequence[Mapping[str, str]]):
+        self._rows = tuple(
+            tuple(
+                (compile_line(key), compile_line(value))
+                for key, value in row.items()
+            )
+            for row in rows
+        )
+        self.keys = tuple(
+            key
+            for row in self._rows
+            for cell in row
+            for line in cell
+            for key in line.keys
+        )
+
+    def expand(
+        self,
+        example_data: Mapping[str, str],
+    ) -> Sequence[dict[str, str]]:
+        return tuple(
+            {
+                key.expand(example_data): value.expand(example_data)
+                for key, value in row
+            }
+            for row in self._rows
+        )
+
+
+StepDataTemplate = TextTemplate | TableTemplate | RowsTemplate
+
+
+def compile_step_data(data) -> StepDataTemplate | None:
+    """Compile the data of a step, e.g. `Step.data`."""
+    if data is None:
+        return None
+    if isinstance(data, str):
+        return TextTemplate(data)
+    if isinstance(data, Table):
+        return TableTemplate(data)
+    return RowsTemplate(data)
+
+
+def _escape_braces(text):
+    return text.replace("{", "{{").replace("}", "}}")
+
+
+def _expand_one_by_one(line, *, example_data):
+    pattern = re.compile(r"(?:^|[^\\])(?:\\\\)*(<(\w+)>)")
+    while match_ := re.search(pattern, line):
+        _, end = match_.span()
+        outer, key = match_.groups()
+        start = end - len(outer)
+        value = example_data[key]
+        line = line[:start] + value + line[end:]
+    return line
@@ -2,7 +2,12 @@ import pathlib
 from collections.abc import Callable, Iterable, Iterator, Sequence
 
 from . import runner
-from .parsing.parser import InputFile, ParsedFile
+from .parsing.parser import (
+    InputFile,
+    ParsedFile,
+    StreamedFile,
+    iter_parse,
+)
 
 
 def find_input_files(
@@ -25,13 +30,43 @@ def iter_input_files(
     root: pathlib.Path,
     extension: str,
 ) -> Iterable[InputFile]:
+    for file in _iter_paths(root=root, extension=extension):
+        with file.open(encoding="utf8") as fio:
+            text = fio.read()
+        yield InputFile(text=text, uri=str(file))
+
+
+def iter_streamed_files(
+    *,
+    root: pathlib.Path,
+    extension: str,
+) -> Iterator[StreamedFile]:
+    """Find regular files and parse them while they are being read.
+
+    Each file is opened only when its scenarios are iterated over
+    and closed once all of them have been read. The results can be
+    passed directly to `execute_file`.
+
+    Params
+    ------
+    root: Where to start searching recursively.
+    extension: Extension of the files to look for.
+    """
+    for file in _iter_paths(root=root, extension=extension):
+        yield iter_parse(_iter_lines(file), uri=str(file))
+
+
+def _iter_paths(*, root, extension):
     for dir_path, _, file_names in root.walk():
         for file_name in file_names:
             file = dir_path / file_name
             if file.suffix in (extension, "." + extension):
-                with file.open(encoding="utf8") as fio:
-                    text = fio.read()
-                yield InputFile(text=text, uri=str(file))
+                yield file
+
+
+def _iter_lines(file):
+    with file.open(encoding="utf8") as fio:
+        yield from fio
 
 
 def iter_tests(
@@ -1,9 +1,15 @@
+import itertools
 import textwrap
 
+import pytest
+
 from rumex import InputFile, StepMapper, run
 from rumex.parsing.table import (
     BadTableLineError,
+    InconsistentTableError,
+    Table,
     parse_table_line,
+    parse_table_lines,
 )
 
 from .test_no_execution_cases import Reporter
@@ -48,6 +54,58 @@ def test_line_parser():
             raise AssertionError("BadTableLineError not raised")
 
 
+def _parse_with_character_loop(line, *, delimiter):
+    line = line.strip()
+    if len(line) < 2 or line[0] != delimiter or line[-1] != delimiter:  # noqa: PLR2004
+        raise BadTableLineError(line)
+    line = line[1:]
+
+    values = []
+    current_value = []
+    escape_next_symbol = False
+    for symbol in line:
+        if escape_next_symbol:
+            current_value.append(symbol)
+            escape_next_symbol = False
+        elif symbol == delimiter:
+            values.append("".join(current_value).strip())
+            current_value = []
+        elif symbol == "\\":
+            escape_next_symbol = True
+        else:
+            current_value.append(symbol)
+
+    if current_value:
+        raise BadTableLineError(line)
+
+    return tuple(values)
+
+
+def _get_result(parse, line):
+    try:
+        return parse(line, delimiter="|")
+    except BadTableLineError as exc:
+        return exc.args
+
+
+def test_fast_paths_match_character_loop():
+    for length in range(7):
+        for symbols in itertools.product("| \\a", repeat=length):
+            line = "".join(symbols)
+            expected = _get_result(_parse_with_character_loop, line)
+            assert _get_result(parse_table_line, line) == expected, line
+            assert (
+                _get_result(
+                    lambda line, delimiter: parse_table_lines(
+                        [line],
+                        delimiter=delimiter,
+                    )[0],
+                    line,
+                )
+                == expected
+            ), line
+
+
 def test_simple_table():
     text = textwrap.dedent("""
         Scenario: Step with a table
@@ -168,3 +226,61 @@ def test_steps_with_a_block_of_text():
 
     (executed_file,) = reporter.reported
     assert executed_file.success
+
+
+def test_table_behaves_like_a_sequence_of_dicts():
+    table = Table(("a", "b", "a"), [("1", "2", "3"), ("4", "5")])
+
+    assert len(table) == 2  # noqa: PLR2004
+    assert table[0] == {"a": "3", "b": "2"}
+    assert list(table) == [{"a": "3", "b": "2"}, {"a": "4", "b": "5"}]
+    assert table == ({"a": "3", "b": "2"}, {"a": "4", "b": "5"})
+    assert table[1:] == [{"a": "4", "b": "5"}]
+    assert table != [{"a": "3", "b": "2"}]
+    assert table == Table(("a", "b", "a"), (("1", "2", "3"), ("4", "5")))
+    assert len({table, Table(table.header, table.rows)}) == 1
+    assert not Table()
+
+
+def test_table_columns():
+    table = Table(("a", "b", "a"), [("1", "2", "3"), ("4", "5", "6")])
+
+    assert table.column("a") == ("3", "6")
+    assert table.column("b") == ("2", "5")
+    with pytest.raises(KeyError):
+        table.column("c")
+    with pytest.raises(InconsistentTableError):
+        Table(("a", "b"), [("1", "2"), ("3",)]).column("b")
+
+
+def test_columns_of_evaluated_tables():
+    text = textwrap.dedent("""
+        Scenario: Columnar access
+
+        Given prices:
+            | item | price   |
+            | a    | <price> |
+            | b    | 2       |
+
+        Examples:
+            | price |
+            | 1     |
+            | 3     |
+    """)
+    reporter = Reporter()
+    steps = StepMapper()
+    totals = []
+
+    @steps(r"Given prices")
+    def given_(*, data):
+        totals.append(sum(map(int, data.column("price"))))
+
+    run(
+        files=[InputFile(uri="we", text=text)],
+        reporter=reporter,
+        steps=steps,
+    )
+
+    (executed_file,) = reporter.reported
+    assert executed_file.success
+    assert totals == [3, 5]
@@ -1,7 +1,10 @@
 import textwrap
 
 from rumex import InputFile, StepMapper, run
+from rumex.parsing.diagnostics import parse_with_diagnostics, validate_files
 from rumex.parsing.parser import CannotParseLineError
+from rumex.parsing.table import BadTableLineError
+from rumex.parsing.tokenizer import CannotTokenizeLineError, TokenKind
 
 from .test_no_execution_cases import Reporter
 
@@ -31,3 +34,69 @@ def test_parsing_error_gives_problem_location_details():
     assert "-> Unexpected line <-" in msg
     assert uri in msg
     assert "line no. 5" in msg
+
+
+def test_all_errors_are_collected():
+    text = textwrap.dedent(
+        """
+        Name: Broken file
+
+        Scenario: Good
+            Given 1
+
+        Scenario: Bad table
+            Given a table
+                | a | b |
+                | a \\|
+            Then this line is skipped
+
+        Scenario: Also good
+            Given 2
+
+        @tag
+        Scenario: Unexpected examples
+            Examples:
+
+        Scenario: Last one is good
+    """.strip(),
+    )
+
+    parsed, diagnostics = parse_with_diagnostics(
+        InputFile(uri="broken", text=text),
+    )
+
+    assert parsed.name == "Broken file"
+    assert [s.name for s in parsed.scenarios] == [
+        "Good",
+        "Also good",
+        "Last one is good",
+    ]
+    table_error, examples_error = diagnostics
+    assert table_error.line_num == 8  # noqa: PLR2004
+    assert isinstance(table_error.exception, BadTableLineError)
+    assert "ERR> 9:" in table_error.message
+    assert "Then this line is skipped" in table_error.message
+    assert examples_error.line_num == 16  # noqa: PLR2004
+    assert isinstance(examples_error.exception, KeyError)
+
+    validated = validate_files(
+        [InputFile(uri="broken", text=text), InputFile(uri="ok", text="")],
+    )
+    assert [d.message for d in validated] == [
+        table_error.message,
+        examples_error.message,
+    ]
+
+
+def test_untokenizable_lines_are_reported():
+    def match_name(line):
+        if line.startswith("Name:"):
+            return TokenKind.NAME_KW, line
+        return None
+
+    _, (diagnostic,) = parse_with_diagnostics(
+        InputFile(uri="x", text="Name: x\n?"),
+        tokenizers=[match_name],
+    )
+    assert isinstance(diagnostic.exception, CannotTokenizeLineError)
+    assert diagnostic.line == "?"
@@ -0,0 +1,50 @@
+from rumex import InputFile, StepMapper, run
+from rumex.parallel import ProcessPoolMap, parse_files
+from rumex.parsing.parser import parse
+
+from .test_no_execution_cases import Reporter
+
+FILES = [
+    InputFile(uri=f"file_{i}", text=f"Name: File {i}\nScenario: S {i}")
+    for i in range(7)
+]
+
+
+def test_parse_files_in_order():
+    parsed = list(parse_files(FILES, max_workers=2, chunksize=3))
+    assert parsed == [parse(file) for file in FILES]
+
+
+def test_parse_files_as_completed():
+    parsed = parse_files(FILES, max_workers=2, chunksize=2, ordered=False)
+    assert sorted(parsed, key=lambda file: file.uri) == [
+        parse(file) for file in FILES
+    ]
+
+
+def test_parsing_and_execution_can_use_different_maps():
+    reporter = Reporter()
+    run(
+        files=FILES,
+        steps=StepMapper(),
+        reporter=reporter,
+        parser_map=ProcessPoolMap(max_workers=2),
+    )
+    assert [file.name for file in reporter.reported] == [
+        f"File {i}" for i in range(7)
+    ]
+    assert all(file.success for file in reporter.reported)
+
+
+def test_files_can_be_executed_in_other_processes():
+    reporter = Reporter()
+    run(
+        files=FILES,
+        steps=StepMapper(),
+        reporter=reporter,
+        map_=ProcessPoolMap(max_workers=2, ordered=False),
+    )
+    assert sorted(file.uri for file in reporter.reported) == sorted(
+        file.uri for file in FILES
+    )
+    assert all(file.success for file in reporter.reported)
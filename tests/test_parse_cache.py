@@ -0,0 +1,75 @@
+import pathlib
+import tempfile
+
+from rumex import InputFile
+from rumex.parsing.cache import CachedParser
+from rumex.parsing.parser import parse
+
+TEXT = """
+Name: Cached
+
+Scenario: One
+    Given a table
+        | a | b |
+        | 1 | 2 |
+"""
+
+
+class CountingParser:
+    def __init__(self):
+        self.parsed = []
+
+    def __call__(self, input_file):
+        self.parsed.append(input_file.uri)
+        return parse(input_file)
+
+
+def test_files_are_parsed_once():
+    with tempfile.TemporaryDirectory() as dir_name:
+        directory = pathlib.Path(dir_name)
+        parser = CountingParser()
+        cached = CachedParser(directory=directory, parser=parser)
+
+        first = cached(InputFile(uri="a", text=TEXT))
+        second = cached(InputFile(uri="b", text=TEXT))
+        assert parser.parsed == ["a"]
+        assert (cached.hits, cached.misses) == (1, 1)
+        assert first == parse(InputFile(uri="a", text=TEXT))
+        assert second == parse(InputFile(uri="b", text=TEXT))
+
+        # Entries survive between runs.
+        warm = CachedParser(directory=directory, parser=parser)
+        assert warm(InputFile(uri="a", text=TEXT)) == first
+        assert (warm.hits, warm.misses) == (1, 0)
+
+        # But not between versions of the parser.
+        new_version = CachedParser(
+            directory=directory,
+            parser=parser,
+            version="other",
+        )
+        new_version(InputFile(uri="a", text=TEXT))
+        assert (new_version.hits, new_version.misses) == (0, 1)
+
+
+def test_least_recently_used_entries_are_evicted():
+    with tempfile.TemporaryDirectory() as dir_name:
+        directory = pathlib.Path(dir_name)
+        texts = [TEXT + f"\nScenario: {i}" for i in range(3)]
+
+        cached = CachedParser(directory=directory)
+        cached(InputFile(uri="x", text=texts[0]))
+        (entry,) = directory.glob("*.parsed")
+        max_bytes = entry.stat().st_size * 5 // 2
+
+        cached = CachedParser(directory=directory, max_bytes=max_bytes)
+        cached(InputFile(uri="x", text=texts[1]))
+        cached(InputFile(uri="x", text=texts[0]))  # now most recently used
+        cached(InputFile(uri="x", text=texts[2]))  # evicts texts[1]
+        assert len(list(directory.glob("*.parsed"))) == 2  # noqa: PLR2004
+
+        cached.hits = cached.misses = 0
+        cached(InputFile(uri="x", text=texts[0]))
+        cached(InputFile(uri="x", text=texts[2]))
+        cached(InputFile(uri="x", text=texts[1]))
+        assert (cached.hits, cached.misses) == (2, 1)
@@ -0,0 +1,261 @@
+import dataclasses
+import pathlib
+import tempfile
+import textwrap
+
+import pytest
+
+from rumex import InputFile, StepMapper, execute_file, run
+from rumex.parsing.lazy import lazy_parse
+from rumex.parsing.parser import (
+    CannotParseLineError,
+    State,
+    StateMachine,
+    default_state_machine,
+    iter_parse,
+    parse,
+    stream_parse,
+)
+from rumex.parsing.tokenizer import TokenKind
+
+from .test_no_execution_cases import Reporter
+
+
+def test_compiled_table_mirrors_state_machine():
+    compiled = default_state_machine.compile()
+
+    assert compiled is default_state_machine.compile()
+    assert compiled.states[0] == State.START
+    assert set(compiled.states) == set(State)
+    for state, transitions in default_state_machine.items():
+        row = compiled.rows[compiled.states.index(state)]
+        assert row.keys() == transitions.keys()
+        for kind, (next_state, callback) in transitions.items():
+            next_index, compiled_callback = row[kind]
+            assert compiled.states[next_index] == next_state
+            assert compiled_callback is callback
+
+
+def test_custom_state_machine():
+    names = []
+
+    def set_name(builder, name):
+        names.append(name)
+        builder.name = name
+
+    state_machine = StateMachine(
+        {
+            State.START: {
+                TokenKind.NAME_KW: (State.FILE_NAME, set_name),
+            },
+            State.FILE_NAME: {
+                TokenKind.NAME_KW: (State.FILE_NAME, set_name),
+            },
+        },
+    )
+    text = "Name: a\nName: b"
+
+    parsed = parse(
+        InputFile(uri="x", text=text),
+        state_machine=state_machine,
+    )
+    assert parsed.name == "b"
+    assert names == ["a", "b"]
+
+    with pytest.raises(KeyError, match=r"State\.FILE_NAME"):
+        parse(
+            InputFile(uri="x", text=text + "\n\n"),
+            state_machine=state_machine,
+        )
+
+
+def test_unexpected_token_in_undefined_state():
+    state_machine = {
+        State.START: {
+            TokenKind.NAME_KW: (State.FILE_NAME, lambda *_: None),
+        },
+    }
+    with pytest.raises(KeyError, match=r"State\.FILE_NAME"):
+        parse(
+            InputFile(uri="x", text="Name: a\nName: b"),
+            state_machine=state_machine,
+        )
+
+
+def test_callback_errors_are_reported_with_context():
+    text = textwrap.dedent("""
+        Scenario: Bad table
+            Given a table
+                | a | b |
+                | a \\|
+    """)
+    with pytest.raises(CannotParseLineError, match=r"ERR> 5:.*a \\\|"):
+        parse(InputFile(uri="x", text=text))
+
+
+STREAMED_TEXT = textwrap.dedent('''
+    Name: Streamed file
+    Described.
+
+    @first
+    Scenario: One
+        Given a step
+            """
+            Scenario: not a scenario
+            """
+
+    Scenario: Two
+        Given <x>
+
+        Examples:
+            | x |
+            | 1 |
+
+    Scenario: Three
+''')
+
+
+def test_streamed_file_is_the_same_as_parsed_file():
+    parsed = parse(InputFile(uri="x", text=STREAMED_TEXT))
+    streamed = iter_parse(STREAMED_TEXT.splitlines(keepends=True), uri="x")
+
+    assert list(streamed.scenarios) == list(parsed.scenarios)
+    assert streamed.name == parsed.name
+    assert streamed.description == parsed.description
+    assert streamed.uri == parsed.uri
+
+
+def test_scenarios_are_yielded_as_soon_as_they_are_complete():
+    read = []
+
+    def iter_lines():
+        for line in STREAMED_TEXT.splitlines(keepends=True):
+            read.append(line)
+            yield line
+
+    streamed = iter_parse(iter_lines(), uri="x")
+    assert not read
+
+    assert streamed.name == "Streamed file"
+    assert streamed.description == "Described."
+    assert read[-1] == "@first\n"
+
+    scenarios = streamed.scenarios
+    assert next(scenarios).name == "One"
+    assert read[-1] == "Scenario: Two\n"
+    assert next(scenarios).name == "Two"
+    assert next(scenarios).name == "Three"
+    assert next(scenarios, None) is None
+
+
+def test_streamed_files_can_be_executed():
+    steps = StepMapper()
+    executed_steps = []
+
+    @steps(r"Given (\w+)")
+    def given(value):
+        executed_steps.append(value)
+
+    with tempfile.TemporaryDirectory() as dir_name:
+        path = pathlib.Path(dir_name) / "streamed.feature"
+        path.write_text(STREAMED_TEXT, encoding="utf8")
+        with path.open(encoding="utf8") as fio:
+            executed = execute_file(
+                iter_parse(fio, uri=str(path)),
+                steps=steps,
+                context_maker=None,
+            )
+
+    assert executed.success
+    assert executed.name == "Streamed file"
+    assert [s.name for s in executed.scenarios] == ["One", "Two", "Three"]
+    assert executed_steps == ["a", "1"]
+
+    reporter = Reporter()
+    run(
+        files=[InputFile(uri="x", text=STREAMED_TEXT)],
+        parser=stream_parse,
+        steps=steps,
+        reporter=reporter,
+    )
+    (executed,) = reporter.reported
+    assert executed.success
+    assert len(executed.scenarios) == 3  # noqa: PLR2004
+
+
+def test_lazy_file_is_the_same_as_parsed_file():
+    parsed = parse(InputFile(uri="x", text=STREAMED_TEXT))
+    lazy = lazy_parse(InputFile(uri="x", text=STREAMED_TEXT))
+
+    assert (lazy.name, lazy.description, lazy.uri) == (
+        parsed.name,
+        parsed.description,
+        parsed.uri,
+    )
+    assert [(s.name, s.tags, s.line_num) for s in lazy.scenarios] == [
+        ("One", ("first",), 4),
+        ("Two", (), 11),
+        ("Three", (), 18),
+    ]
+    for lazy_scenario, scenario in zip(
+        lazy.scenarios,
+        parsed.scenarios,
+        strict=True,
+    ):
+        assert lazy_scenario.steps == scenario.steps
+        assert lazy_scenario.description == scenario.description
+        assert lazy_scenario.examples_data == scenario.examples_data
+
+
+def test_lazy_scenarios_are_built_on_demand():
+    text = textwrap.dedent("""
+        Scenario: Good
+            Given <x>
+
+            Examples:
+                | x |
+                | 1 |
+
+        @broken
+        Scenario: Bad
+            Given a table
+                | a | b |
+                | a \\|
+    """)
+    lazy = lazy_parse(InputFile(uri="x", text=text))
+
+    good, bad = lazy.scenarios
+    assert bad.tags == ("broken",)
+    with pytest.raises(CannotParseLineError, match=r"line no\. 13"):
+        _ = bad.steps
+
+    steps = StepMapper()
+    values = []
+
+    @steps(r"Given (\d)")
+    def given(value: int):
+        values.append(value)
+
+    executed = execute_file(
+        dataclasses.replace(lazy, scenarios=[good]),
+        steps=steps,
+        context_maker=None,
+    )
+    assert executed.success
+    assert values == [1]
+
+
+def test_repeated_strings_are_shared_between_files():
+    first, second = (
+        parse(InputFile(uri=uri, text=STREAMED_TEXT)) for uri in "ab"
+    )
+    (first_step,) = first.scenarios[0].steps
+    (second_step,) = second.scenarios[0].steps
+
+    assert first_step.sentence is second_step.sentence
+    assert first.scenarios[0].tags[0] is second.scenarios[0].tags[0]
+    assert (
+        first.scenarios[1].examples_data.header[0]
+        is second.scenarios[1].examples_data.header[0]
+    )
+    assert not hasattr(first_step, "__dict__")
@@ -0,0 +1,191 @@
+import inspect
+import random
+import re
+import textwrap
+
+from rumex import InputFile, StepMapper, run
+from rumex.runner import (
+    MatchingFunctionNotFoundError,
+    _get_required_words,
+    _StepIndex,
+)
+
+from .test_no_execution_cases import Reporter
+
+PATTERNS = [
+    r"(\w+) says hello",
+    r"^the user (\w+) logs in$",
+    r"\bthe basket has (\d+) items?",
+    r"(?i)The user (\w+) logs in",
+    r"the user (\w+)|the admin",
+    r"the (\w+) has (\d+) items",
+    r"Given (1234)",
+    r"(\w+) says hello to (\w+)",
+    r"",
+    r"the user \w+ logs out",
+]
+
+
+def test_required_words():
+    assert [sorted(_get_required_words(re.compile(p))) for p in PATTERNS] == [
+        ["says"],
+        ["in", "logs", "the", "user"],
+        ["basket", "has", "the"],
+        [],  # Flags are not analysed.
+        [],  # Alternatives have no required words.
+        ["has"],
+        [],
+        ["hello", "says", "to"],
+        [],
+        ["logs", "user"],
+    ]
+
+
+def _linear_search(patterns, sentence):
+    for pattern in patterns:
+        if match_ := pattern.search(sentence):
+            return match_
+    return None
+
+
+def test_index_finds_first_registered_pattern():
+    rng = random.Random(0)  # noqa: S311
+    words = ["the", "user", "basket", "has", "says", "hello", "to", "x"]
+    sentences = [
+        " ".join(
+            rng.choice([*words, "3", "bob", "Given 1234"]) for _ in range(5)
+        )
+        for _ in range(2000)
+    ]
+    sentences += [
+        "Given the user bob logs in",
+        "the user bob logs out",
+        "THE USER BOB LOGS IN",
+        "Then bob says hello to alice",
+    ]
+    for _ in range(20):
+        patterns = [re.compile(p) for p in rng.sample(PATTERNS, 6)]
+        index = _StepIndex()
+        for pattern in patterns:
+            index.add(pattern)
+        for sentence in sentences:
+            expected = _linear_search(patterns, sentence)
+            found = index.search(sentence)
+            assert (found and found.re) is (expected and expected.re)
+
+
+def test_first_registered_step_wins():
+    text = textwrap.dedent("""
+        Scenario: Overlapping steps
+
+        Given bob says hi to alice
+        And bob says hello to alice
+        And Bob says hi to eve
+        And alice says
+    """)
+    steps = StepMapper()
+    called = []
+
+    @steps(r"(\w+) says hello to (\w+)")
+    def first(a, b):
+        called.append(("first", a, b))
+
+    @steps(r"(\w+) says (\w+) to alice")
+    def second(a, b):
+        called.append(("second", a, b))
+
+    @steps(r"(?i)BOB SAYS")
+    def third():
+        called.append(("third",))
+
+    reporter = Reporter()
+    run(
+        files=[InputFile(uri="file", text=text)],
+        steps=steps,
+        reporter=reporter,
+    )
+    assert called == [
+        ("second", "bob", "hi"),
+        ("first", "bob", "alice"),
+        ("third",),
+    ]
+    (executed_file,) = reporter.reported
+    (scenario,) = executed_file.scenarios
+    assert isinstance(
+        scenario.steps[-1].exception,
+        MatchingFunctionNotFoundError,
+    )
+
+
+def test_matched_sentences_are_cached():
+    text = textwrap.dedent("""
+        Scenario: Outline
+
+        Given an empty database
+        And a user called <name>
+
+        Examples:
+            | name  |
+            | Alice |
+            | Bob   |
+            | Alice |
+    """)
+    steps = StepMapper(cache_size=2)
+    users = []
+
+    @steps(r"an empty database")
+    def empty_database():
+        pass
+
+    @steps(r"a user called (\w+)")
+    def user_called(name):
+        users.append(name)
+
+    files = [InputFile(uri="file", text=text)]
+    run(files=files, steps=steps, reporter=Reporter())
+    assert users == ["Alice", "Bob", "Alice"]
+    info = steps.cache_info()
+    assert (info.hits, info.misses, info.currsize) == (2, 4, 2)
+
+    @steps(r"a user called Bob")
+    def bob():
+        users.append("not Bob")
+
+    assert steps.cache_info().currsize == 0
+    run(files=files, steps=steps, reporter=Reporter())
+    assert users[3:] == ["Alice", "Bob", "Alice"]
+
+
+def test_step_functions_are_inspected_once(monkeypatch):
+    text = textwrap.dedent("""
+        Scenario: Outline
+
+        Given <a> and <b>
+
+        Examples:
+            | a | b |
+            | 1 | 2 |
+            | 3 | 4 |
+    """)
+    inspected = []
+    getfullargspec = inspect.getfullargspec
+    monkeypatch.setattr(
+        inspect,
+        "getfullargspec",
+        lambda fn: inspected.append(fn) or getfullargspec(fn),
+    )
+    steps = StepMapper()
+    sums = []
+
+    @steps(r"(\d+) and (\d+)")
+    def add(a: int, b: int, *, context, data):
+        sums.append((a + b, context, data))
+
+    run(
+        files=[InputFile(uri="file", text=text)],
+        steps=steps,
+        context_maker=lambda: "context",
+        reporter=Reporter(),
+    )
+    assert inspected == [add]
+    assert sums == [(3, "context", None), (7, "context", None)]
@@ -0,0 +1,90 @@
+import itertools
+import textwrap
+
+import pytest
+
+from rumex import InputFile, StepMapper, run
+from rumex.parsing.table import Table
+from rumex.templates import (
+    LineTemplate,
+    TableTemplate,
+    TextTemplate,
+    _expand_one_by_one,
+)
+
+from .test_no_execution_cases import Reporter
+
+
+def test_lines_expand_as_when_substituted_one_by_one():
+    symbols = ["<", ">", "a", "b", "\\", " "]
+    values = ["", "1", "\\", "<a>", "<b", "{0}", "}", "a\\"]
+    lines = [
+        "".join(chars)
+        for length in range(6)
+        for chars in itertools.product(symbols, repeat=length)
+    ]
+    for line, a, b in itertools.product(
+        lines,
+        values,
+        ["<b>", "2", "\\"],
+    ):
+        example_data = {"a": a, "b": b}
+        template = LineTemplate(line)
+        try:
+            expected = _expand_one_by_one(line, example_data=example_data)
+        except KeyError as exc:
+            with pytest.raises(KeyError) as exc_info:
+                template.expand(example_data)
+            assert exc_info.value.args == exc.args
+        else:
+            assert template.expand(example_data) == expected, (line, a, b)
+
+
+def test_templates_without_placeholders_are_not_copied():
+    text = "first line\nsecond <line"
+    assert TextTemplate(text).expand({}) == text
+
+    template = TableTemplate(Table(["a", "b"], [["1", "2", "3"]]))
+    assert template.expand({"x": "1"}) is template.expand({"x": "2"})
+    assert template.expand({}) == Table(["a", "b"], [["1", "2"]])
+
+
+def test_placeholders_in_all_parts_of_steps():
+    text = textwrap.dedent('''
+        Scenario: Outline
+
+        Given <name> buys:
+            | <item> | static |
+            | <item> | 1      |
+        And a note:
+            """
+            for <name>, with {braces}
+            """
+
+        Examples:
+            | name  | item  |
+            | Alice | apple |
+            | Bob   | pear  |
+    ''')
+    steps = StepMapper()
+    bought = []
+
+    @steps(r"Given (\w+) buys:")
+    def buy(name, *, data):
+        bought.append((name, data))
+
+    @steps(r"And a note:")
+    def note(*, data):
+        bought.append(data)
+
+    run(
+        files=[InputFile(uri="file", text=text)],
+        steps=steps,
+        reporter=Reporter(),
+    )
+    assert bought == [
+        ("Alice", [{"apple": "apple", "static": "1"}]),
+        "for Alice, with {braces}",
+        ("Bob", [{"pear": "pear", "static": "1"}]),
+        "for Bob, with {braces}",
+    ]
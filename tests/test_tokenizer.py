@@ -0,0 +1,115 @@
+import re
+
+from rumex.parsing.tokenizer import (
+    Token,
+    Tokenizers,
+    TokenKind,
+    compile_tokenizers,
+    default_tokenizers,
+    iter_tokens,
+    match_blank_line,
+    match_description,
+    match_name,
+)
+
+TRICKY_LINES = [
+    "",
+    " ",
+    "\t \u00a0",
+    '"""',
+    '   """   ',
+    '""""',
+    'x """',
+    "Name: My file",
+    "Name:",
+    "Name:    ",
+    "  Name:  spaced  ",
+    "Names: not a keyword",
+    "@tag",
+    "  @tag_2  ",
+    "@two tags",
+    "@",
+    "@-",
+    "Scenario: A scenario",
+    "Scenario:",
+    "Scenario: \t ",
+    "  Scenario:x",
+    "Given",
+    "Given ",
+    "  Given   ",
+    "Given x",
+    "  When we do stuff",
+    "Then\tthe tab is not a space",
+    "And finally  ",
+    "Andrew is not a keyword",
+    "Examples:",
+    "  Examples:   ",
+    "Examples: with a value",
+    "| a | b |",
+    "Just a description.",
+    "\u3000Given an ideographic space",
+]
+
+
+def _reference_classify(line):  # noqa: PLR0911
+    """Straightforward chain of string checks, for comparison."""
+    if line.strip() == '"""':
+        return TokenKind.TRIPLE_QUOTE, None
+    if (match_ := re.match(r"^\s*Name:\s*(.*)$", line)) and match_[1]:
+        return TokenKind.NAME_KW, match_[1]
+    if match_ := re.match(r"^\s*@(\w+)\s*$", line):
+        return TokenKind.SCENARIO_TAG, match_[1]
+    if (match_ := re.match(r"^\s*Scenario:\s*(.*)$", line)) and match_[1]:
+        return TokenKind.SCENARIO_KW, match_[1]
+    if line.strip().startswith(("Given ", "When ", "Then ", "And ")):
+        return TokenKind.STEP_KW, line
+    if re.match(r"^\s*Examples:\s*$", line):
+        return TokenKind.EXAMPLES, None
+    if not line.strip():
+        return TokenKind.BLANK_LINE, line
+    return TokenKind.DESCRIPTION, line
+
+
+def test_default_tokenizers_classify_lines_as_before():
+    classify = compile_tokenizers(default_tokenizers)
+    for line in TRICKY_LINES:
+        assert classify(line) == _reference_classify(line), line
+        for tokenizer in default_tokenizers:
+            if kind_and_value := tokenizer(line):
+                break
+        assert kind_and_value == _reference_classify(line), line
+
+
+def test_token_stream():
+    text = "\n".join(TRICKY_LINES)
+    assert list(iter_tokens(text)) == [
+        Token(kind=kind, value=value, line=line, line_num=i)
+        for i, line in enumerate(text.splitlines())
+        for kind, value in [_reference_classify(line)]
+    ]
+
+
+def test_custom_functions_are_called_in_order():
+    def match_comment(line):
+        if line.lstrip().startswith("#"):
+            return "COMMENT", line
+        return None
+
+    tokenizers = Tokenizers(
+        match_name,
+        match_comment,
+        match_blank_line,
+        match_description,
+    )
+    tokens = list(iter_tokens("Name: x\n# Name: y\n\nz", tokenizers))
+    assert [(t.kind, t.value) for t in tokens] == [
+        (TokenKind.NAME_KW, "x"),
+        ("COMMENT", "# Name: y"),
+        (TokenKind.BLANK_LINE, ""),
+        (TokenKind.DESCRIPTION, "z"),
+    ]
+
+    # Unhashable sequences of tokenizers work too.
+    assert list(iter_tokens("Name: x", [match_comment, match_name])) == [
+        Token(kind=TokenKind.NAME_KW, value="x", line="Name: x", line_num=0),
+    ]